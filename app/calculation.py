@@ -4,7 +4,7 @@
 
 from dataclasses import dataclass, field
 import datetime
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal, InvalidOperation, getcontext, localcontext
 import logging
 from typing import Any, Dict
 
@@ -61,13 +61,12 @@ class Calculation:
             "Multiplication": lambda x, y: x * y,
             "Division": lambda x, y: x / y if y != 0 else self._raise_div_zero(),
             "Power": lambda x, y: (
-                Decimal(pow(float(x), float(y)))
-                if y >= 0
+                self._power(x, y) if y >= 0
                 else self._raise_neg_power()
             ),
             "Root": lambda x, y: (
-                Decimal(pow(float(x), 1 / float(y))) 
-                if x >= 0 and y != 0 
+                self._plain_integral(Decimal(repr(float(x) ** (1.0 / float(y)))))
+                if x >= 0 and y != 0
                 else self._raise_invalid_root(x, y)
             ),
             "Modulus": lambda x, y: (
@@ -75,7 +74,7 @@ class Calculation:
                 else self._raise_div_zero()
             ),
             "Int_Divide": lambda x, y: (
-                int(x / y) if y != 0
+                self._int_divide(x, y) if y != 0
                 else self._raise_div_zero()
             ),
             "Percent": lambda x, y: (
@@ -115,6 +114,58 @@ class Calculation:
         """
         raise OperationError("Negative exponents are not supported")
 
+    @staticmethod
+    def _power(x: Decimal, y: Decimal) -> Decimal:
+        """
+        Helper method to raise a number to a non-negative power.
+
+        Integral exponents stay in Decimal; fractional ones go through floats.
+
+        Args:
+            x (Decimal): The base.
+            y (Decimal): The exponent.
+        """
+        if y != y.to_integral_value():
+            if x < 0:
+                raise OperationError("Fractional exponents of negative numbers are not supported")
+            return Calculation._plain_integral(Decimal(repr(float(x) ** float(y))))
+        if not x and not y:
+            # Decimal rejects 0 ** 0; keep the conventional result
+            return Decimal(1)
+        return Calculation._plain_integral(x ** int(y))
+
+    @staticmethod
+    def _plain_integral(value: Decimal) -> Decimal:
+        """
+        Helper method to give integral results a plain form.
+
+        Keeps stored history readable (1000 rather than 1E+3, 3 rather than 3.0)
+        for values that fit within the context precision.
+
+        Args:
+            value (Decimal): The result to format.
+        """
+        if value == value.to_integral_value() and value.adjusted() < getcontext().prec:
+            return value.quantize(Decimal(1))
+        return value
+
+    @staticmethod
+    def _int_divide(x: Decimal, y: Decimal) -> Decimal:
+        """
+        Helper method to perform integer division.
+
+        Raises the precision just enough for the whole quotient, since Decimal
+        floor division fails when the quotient has more digits than the context
+        precision.
+
+        Args:
+            x (Decimal): The dividend.
+            y (Decimal): The divisor.
+        """
+        with localcontext() as ctx:
+            ctx.prec = max(ctx.prec, x.adjusted() - y.adjusted() + 2)
+            return x // y
+
     @staticmethod
     def _raise_invalid_root(x: Decimal, y: Decimal):  # pragma: no cover
         """
@@ -8,17 +8,213 @@ import logging
 from app.calculator import Calculator
 from app.exceptions import OperationError, ValidationError
 from app.history import AutoSaveObserver, LoggingObserver
-from app.operations import OperationFactory
+from app.operations import Operation, OperationFactory
 
 from colorama import Fore, Style, init
 from dotenv import load_dotenv
-import os
+import sys
 
 init(autoreset=True)
 load_dotenv()
 
-PRECISION = int(os.getenv('CALCULATOR_PRECISION', 10))
-MAX_INPUT_VALUE = Decimal(os.getenv('CALCULATOR_MAX_INPUT_VALUE', '1e999'))
+# Color codes bound once; ANSI sequences are skipped entirely when output is
+# not a terminal (e.g. piped to a file or captured in CI)
+if sys.stdout.isatty():  # pragma: no cover
+    _CYAN, _GREEN, _YELLOW, _RED = Fore.CYAN, Fore.GREEN, Fore.YELLOW, Fore.RED
+    _WHITE, _BLUE, _MAGENTA = Fore.WHITE, Fore.BLUE, Fore.MAGENTA
+    _RESET, _BRIGHT = Style.RESET_ALL, Style.BRIGHT
+else:
+    _CYAN = _GREEN = _YELLOW = _RED = _WHITE = _BLUE = _MAGENTA = _RESET = _BRIGHT = ""
+
+# Sentinels returned by command handlers to drive the REPL loop
+_CONTINUE = object()
+_BREAK = object()
+
+# Commands that run an arithmetic operation, resolved once to the shared
+# operation instances provided by the Factory pattern
+_ARITH_OPS = {
+    command: OperationFactory.create_operation(command)
+    for command in (
+        'add', 'subtract', 'multiply', 'divide', 'power',
+        'root', 'modulus', 'int_divide', 'percent', 'abs_diff'
+    )
+}
+
+# Prompts and fixed messages, colorized once at import
+_START_MSG = f"{_CYAN}Calculator started. Type 'help' for commands.{_RESET}"
+_PROMPT = f"\n{_WHITE}Enter command: {_RESET}"
+_EXIT_SAVED_MSG = f"{_GREEN}History saved successfully.{_RESET}"
+_GOODBYE_MSG = f"{_RED}{_BRIGHT}Goodbye!{_RESET}"
+_EMPTY_HISTORY_MSG = f"{_YELLOW}No calculations in history{_RESET}"
+_HISTORY_HEADER = f"\n{_CYAN}Calculation History:{_RESET}"
+_CLEARED_MSG = f"{_GREEN}History cleared{_RESET}"
+_UNDONE_MSG = f"{_GREEN}Operation undone{_RESET}"
+_NOTHING_TO_UNDO_MSG = f"{_YELLOW}Nothing to undo{_RESET}"
+_REDONE_MSG = f"{_GREEN}Operation redone{_RESET}"
+_NOTHING_TO_REDO_MSG = f"{_YELLOW}Nothing to redo{_RESET}"
+_SAVED_MSG = f"{_GREEN}History saved successfully{_RESET}"
+_LOADED_MSG = f"{_GREEN}History loaded successfully{_RESET}"
+_NUMBERS_PROMPT = f"\n{_CYAN}Enter numbers (or 'cancel' to abort):{_RESET}"
+_RESULT_PREFIX = f"\n{_GREEN}{_BRIGHT}Result: "
+_CANCEL_MSG = f"{_YELLOW}Operation cancelled{_RESET}"
+_INTERRUPT_MSG = f"\n{_YELLOW}Operation cancelled{_RESET}"
+_TERMINATED_MSG = f"\n{_CYAN}Input terminated. Exiting...{_RESET}"
+
+# Help banner, built once; the operations line is filled in per call so that
+# operations registered at runtime are still listed
+_HELP_TEXT = "\n".join([
+    f"\n{_CYAN}Available commands:{_RESET}",
+    f"  {_GREEN}Operations:{_RESET}",
+    "    {operations}",
+    f"  {_YELLOW}History:{_RESET}",
+    "    history - Show calculation history",
+    "    clear - Clear calculation history",
+    "    undo - Undo the last calculation",
+    "    redo - Redo the last undone calculation",
+    f"  {_BLUE}File Operations:{_RESET}",
+    "    save - Save calculation history to file",
+    "    load - Load calculation history from file",
+    f"  {_MAGENTA}exit{_RESET} - Exit the calculator",
+])
+
+
+def _is_cancel(value: str) -> bool:
+    """Return True if an operand prompt answer is 'cancel' (any case)."""
+    # Numbers are the common answer; only fold case when the length matches
+    return len(value) == 6 and value.lower() == 'cancel'
+
+
+def _do_help(calc: Calculator) -> object:
+    """Display available commands with organized sections."""
+    print(_HELP_TEXT.format(operations=' , '.join(OperationFactory.list_operations())))
+    return _CONTINUE
+
+
+def _do_exit(calc: Calculator) -> object:
+    """Attempt to save history, then stop the REPL."""
+    try:
+        calc.save_history()
+        print(_EXIT_SAVED_MSG)
+    except Exception as e:
+        print(f"{_YELLOW}Warning: Could not save history: {e}{_RESET}")
+    print(_GOODBYE_MSG)
+    return _BREAK
+
+
+def _do_history(calc: Calculator) -> object:
+    """Display calculation history."""
+    history = calc.show_history()
+    if not history:
+        print(_EMPTY_HISTORY_MSG)
+    else:
+        # Emit the whole listing in one write rather than one print per entry
+        lines = [_HISTORY_HEADER]
+        lines.extend(f"{_WHITE}{i}.{_RESET} {entry}" for i, entry in enumerate(history, 1))
+        print("\n".join(lines))
+    return _CONTINUE
+
+
+def _do_clear(calc: Calculator) -> object:
+    """Clear calculation history."""
+    calc.clear_history()
+    print(_CLEARED_MSG)
+    return _CONTINUE
+
+
+def _do_undo(calc: Calculator) -> object:
+    """Undo the last calculation."""
+    if calc.undo():
+        print(_UNDONE_MSG)
+    else:
+        print(_NOTHING_TO_UNDO_MSG)
+    return _CONTINUE
+
+
+def _do_redo(calc: Calculator) -> object:
+    """Redo the last undone calculation."""
+    if calc.redo():
+        print(_REDONE_MSG)
+    else:
+        print(_NOTHING_TO_REDO_MSG)
+    return _CONTINUE
+
+
+def _do_save(calc: Calculator) -> object:
+    """Save calculation history to file."""
+    try:
+        calc.save_history()
+        print(_SAVED_MSG)
+    except Exception as e:
+        print(f"{_RED}Error saving history: {e}{_RESET}")
+    return _CONTINUE
+
+
+def _do_load(calc: Calculator) -> object:
+    """Load calculation history from file."""
+    try:
+        calc.load_history()
+        print(_LOADED_MSG)
+    except Exception as e:
+        print(f"{_RED}Error loading history: {e}{_RESET}")
+    return _CONTINUE
+
+
+def _do_arithmetic(calc: Calculator, operation: Operation) -> None:
+    """Prompt for two operands and perform the specified arithmetic operation."""
+    try:
+        print(_NUMBERS_PROMPT)
+        a = input("First number: ")
+        if _is_cancel(a):
+            print(_CANCEL_MSG)
+            return
+
+        b = input("Second number: ")
+        if _is_cancel(b):
+            print(_CANCEL_MSG)
+            return
+
+        # Only switch strategies when the command differs from the last one
+        if calc.operation_strategy is not operation:
+            calc.set_operation(operation)
+
+        # Perform the calculation
+        result = calc.perform_operation(a, b)
+
+        # Normalize the result if it's a Decimal
+        if isinstance(result, Decimal):
+            result = result.normalize()
+            # Special values ('n', 'N', 'F') carry a string exponent
+            exponent = result.as_tuple().exponent
+            if isinstance(exponent, int):
+                precision = calc.config.precision
+                if -exponent > precision:
+                    result = round(result, precision)
+                elif exponent > 0 and result.adjusted() < precision:
+                    # normalize() folds trailing zeros into the exponent (20 -> 2E+1);
+                    # larger values keep scientific notation so rounding stays visible
+                    result = format(result, 'f')
+
+        print(f"{_RESULT_PREFIX}{result}{_RESET}")
+    except (ValidationError, OperationError) as e:
+        # Handle known exceptions related to validation or operation errors
+        print(f"{_RED}Error: {e}{_RESET}")
+    except Exception as e:
+        # Handle any unexpected exceptions
+        print(f"{_RED}Unexpected error: {e}{_RESET}")
+
+
+# Dispatch table mapping non-arithmetic commands to their handlers
+_HANDLERS = {
+    'help': _do_help,
+    'exit': _do_exit,
+    'history': _do_history,
+    'clear': _do_clear,
+    'undo': _do_undo,
+    'redo': _do_redo,
+    'save': _do_save,
+    'load': _do_load,
+}
+
 
 def calculator_repl():
     """
@@ -35,152 +231,47 @@ def calculator_repl():
         calc.add_observer(LoggingObserver())
         calc.add_observer(AutoSaveObserver(calc))
 
-        print(f"{Fore.CYAN}Calculator started. Type 'help' for commands.{Style.RESET_ALL}")
+        print(_START_MSG)
 
         while True:
             try:
                 # Prompt the user for a command (with subtle color)
-                command = input(f"\n{Fore.WHITE}Enter command: {Style.RESET_ALL}").lower().strip()
-
-                if command == 'help':
-                    # Display available commands with organized sections
-                    print(f"\n{Fore.CYAN}Available commands:{Style.RESET_ALL}")
-                    print(f"  {Fore.GREEN}Operations:{Style.RESET_ALL}")
-                    available_ops = OperationFactory.list_operations()
-                    formatted_ops = ' , '.join(available_ops)
-                    print(f"    {formatted_ops}")
-                    print(f"  {Fore.YELLOW}History:{Style.RESET_ALL}")
-                    print("    history - Show calculation history")
-                    print("    clear - Clear calculation history")
-                    print("    undo - Undo the last calculation")
-                    print("    redo - Redo the last undone calculation")
-                    print(f"  {Fore.BLUE}File Operations:{Style.RESET_ALL}")
-                    print("    save - Save calculation history to file")
-                    print("    load - Load calculation history from file")
-                    print(f"  {Fore.MAGENTA}exit{Style.RESET_ALL} - Exit the calculator")
-                    continue
-
-                if command == 'exit':
-                    # Attempt to save history before exiting
-                    try:
-                        calc.save_history()
-                        print(f"{Fore.GREEN}History saved successfully.{Style.RESET_ALL}")
-                    except Exception as e:
-                        print(f"{Fore.YELLOW}Warning: Could not save history: {e}{Style.RESET_ALL}")
-                    print(f"{Fore.RED}{Style.BRIGHT}Goodbye!{Style.RESET_ALL}")
-                    break
-
-                if command == 'history':
-                    # Display calculation history
-                    history = calc.show_history()
-                    if not history:
-                        print(f"{Fore.YELLOW}No calculations in history{Style.RESET_ALL}")
-                    else:
-                        print(f"\n{Fore.CYAN}Calculation History:{Style.RESET_ALL}")
-                        for i, entry in enumerate(history, 1):
-                            print(f"{Fore.WHITE}{i}.{Style.RESET_ALL} {entry}")
-                    continue
-
-                if command == 'clear':
-                    # Clear calculation history
-                    calc.clear_history()
-                    print(f"{Fore.GREEN}History cleared{Style.RESET_ALL}")
-                    continue
-
-                if command == 'undo':
-                    # Undo the last calculation
-                    if calc.undo():
-                        print(f"{Fore.GREEN}Operation undone{Style.RESET_ALL}")
-                    else:
-                        print(f"{Fore.YELLOW}Nothing to undo{Style.RESET_ALL}")
-                    continue
-
-                if command == 'redo':
-                    # Redo the last undone calculation
-                    if calc.redo():
-                        print(f"{Fore.GREEN}Operation redone{Style.RESET_ALL}")
-                    else:
-                        print(f"{Fore.YELLOW}Nothing to redo{Style.RESET_ALL}")
-                    continue
-
-                if command == 'save':
-                    # Save calculation history to file
-                    try:
-                        calc.save_history()
-                        print(f"{Fore.GREEN}History saved successfully{Style.RESET_ALL}")
-                    except Exception as e:
-                        print(f"{Fore.RED}Error saving history: {e}{Style.RESET_ALL}")
-                    continue
+                command = input(_PROMPT).strip()
+                if not command.islower():
+                    # Only fold case when needed; typed commands are usually lowercase
+                    command = command.lower()
+                # Interned commands match the literal dispatch keys by identity
+                command = sys.intern(command)
 
-                if command == 'load':
-                    # Load calculation history from file
-                    try:
-                        calc.load_history()
-                        print(f"{Fore.GREEN}History loaded successfully{Style.RESET_ALL}")
-                    except Exception as e:
-                        print(f"{Fore.RED}Error loading history: {e}{Style.RESET_ALL}")
+                handler = _HANDLERS.get(command)
+                if handler is not None:
+                    if handler(calc) is _BREAK:
+                        break
                     continue
 
-                if command in ['add', 'subtract', 'multiply', 'divide', 'power', 'root', 'modulus', 'int_divide', 'percent', 'abs_diff']:
-                    # Perform the specified arithmetic operation
-                    try:
-                        print(f"\n{Fore.CYAN}Enter numbers (or 'cancel' to abort):{Style.RESET_ALL}")
-                        a = input("First number: ")
-                        if a.lower() == 'cancel':
-                            print(f"{Fore.YELLOW}Operation cancelled{Style.RESET_ALL}")
-                            continue
-                        # if Decimal(a) > MAX_INPUT_VALUE:
-                        #     print(f"Error: Input exceeds maximum allowed value of {MAX_INPUT_VALUE}")
-                        #     continue
-
-                        b = input("Second number: ")
-                        if b.lower() == 'cancel':
-                            print(f"{Fore.YELLOW}Operation cancelled{Style.RESET_ALL}")
-                            continue
-                        # if Decimal(b) > MAX_INPUT_VALUE:
-                        #     print(f"Error: Input exceeds maximum allowed value of {MAX_INPUT_VALUE}")
-                        #     continue
-
-                        # Create the appropriate operation instance using the Factory pattern
-                        operation = OperationFactory.create_operation(command)
-                        calc.set_operation(operation)
-
-                        # Perform the calculation
-                        result = calc.perform_operation(a, b)
-
-                        # Normalize the result if it's a Decimal
-                        if isinstance(result, Decimal):
-                            result = result.normalize()
-                            if len(str(result)[str(result).find('.') + 1:]) > PRECISION:
-                                result = round(result, PRECISION)
-
-                        print(f"\n{Fore.GREEN}{Style.BRIGHT}Result: {result}{Style.RESET_ALL}")
-                    except (ValidationError, OperationError) as e:
-                        # Handle known exceptions related to validation or operation errors
-                        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
-                    except Exception as e:
-                        # Handle any unexpected exceptions
-                        print(f"{Fore.RED}Unexpected error: {e}{Style.RESET_ALL}")
+                operation = _ARITH_OPS.get(command)
+                if operation is not None:
+                    _do_arithmetic(calc, operation)
                     continue
 
                 # Handle unknown commands
-                print(f"{Fore.RED}Unknown command: '{command}'. Type 'help' for available commands.{Style.RESET_ALL}")
+                print(f"{_RED}Unknown command: '{command}'. Type 'help' for available commands.{_RESET}")
 
             except KeyboardInterrupt:
                 # Handle Ctrl+C interruption gracefully
-                print(f"\n{Fore.YELLOW}Operation cancelled{Style.RESET_ALL}")
+                print(_INTERRUPT_MSG)
                 continue
             except EOFError:
                 # Handle end-of-file (e.g., Ctrl+D) gracefully
-                print(f"\n{Fore.CYAN}Input terminated. Exiting...{Style.RESET_ALL}")
+                print(_TERMINATED_MSG)
                 break
             except Exception as e:
                 # Handle any other unexpected exceptions
-                print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+                print(f"{_RED}Error: {e}{_RESET}")
                 continue
 
     except Exception as e:
         # Handle fatal errors during initialization
-        print(f"{Fore.RED}{Style.BRIGHT}Fatal error: {e}{Style.RESET_ALL}")
+        print(f"{_RED}{_BRIGHT}Fatal error: {e}{_RESET}")
         logging.error(f"Fatal error in calculator REPL: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -4,10 +4,17 @@
 
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any
 from app.calculator_config import CalculatorConfig
 from app.exceptions import ValidationError
 
+
+@lru_cache(maxsize=256)
+def _parse_number(text: str) -> Decimal:
+    """Parse a numeric string exactly, reusing results for repeated tokens."""
+    return Decimal(text)
+
 @dataclass
 class InputValidator:
     """Validates and sanitizes calculator inputs."""
@@ -30,9 +37,12 @@ class InputValidator:
         try:
             if isinstance(value, str):
                 value = value.strip()
-            number = Decimal(str(value))
+                # normalize() rounds to the active context, so it is not cached
+                number = _parse_number(value).normalize()
+            else:
+                number = Decimal(str(value)).normalize()
             if abs(number) > config.max_input_value:
                 raise ValidationError(f"Value exceeds maximum allowed: {config.max_input_value}")
-            return number.normalize()
+            return number
         except InvalidOperation as e:
             raise ValidationError(f"Invalid number format: {value}") from e
\ No newline at end of file
@@ -3,10 +3,15 @@
 ########################
 
 from abc import ABC, abstractmethod
-from decimal import Decimal
+from decimal import Decimal, localcontext
+import sys
 from typing import Dict
 from app.exceptions import ValidationError
 
+# Decimal constants shared by the operations, parsed once at import
+_ZERO = Decimal(0)
+_HUNDREDTH = Decimal('0.01')  # Multiplying is cheaper than dividing by 100
+
 
 class Operation(ABC):
     """
@@ -40,7 +45,8 @@ class Operation(ABC):
         Validate operands before execution.
 
         Can be overridden by subclasses to enforce specific validation rules
-        for different operations.
+        for different operations. Operations that don't override it skip the
+        call in execute.
 
         Args:
             a (Decimal): First operand.
@@ -81,7 +87,6 @@ class Addition(Operation):
         Returns:
             Decimal: Sum of the two operands.
         """
-        self.validate_operands(a, b)
         return a + b
 
 
@@ -103,7 +108,6 @@ class Subtraction(Operation):
         Returns:
             Decimal: Difference between the two operands.
         """
-        self.validate_operands(a, b)
         return a - b
 
 
@@ -125,7 +129,6 @@ class Multiplication(Operation):
         Returns:
             Decimal: Product of the two operands.
         """
-        self.validate_operands(a, b)
         return a * b
 
 
@@ -149,8 +152,7 @@ class Division(Operation):
         Raises:
             ValidationError: If the divisor is zero.
         """
-        super().validate_operands(a, b)
-        if b == 0:
+        if b == _ZERO:
             raise ValidationError("Division by zero is not allowed")
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
@@ -179,18 +181,21 @@ class Power(Operation):
         """
         Validate operands for power operation.
 
-        Overrides the base class method to ensure that the exponent is not negative.
+        Overrides the base class method to ensure that the exponent is not negative
+        and that a negative base is only raised to an integral exponent.
 
         Args:
             a (Decimal): Base number.
             b (Decimal): Exponent.
 
         Raises:
-            ValidationError: If the exponent is negative.
+            ValidationError: If the exponent is negative, or fractional with a
+                negative base.
         """
-        super().validate_operands(a, b)
-        if b < 0:
+        if b < _ZERO:
             raise ValidationError("Negative exponents not supported")
+        if a < _ZERO and b != b.to_integral_value():
+            raise ValidationError("Fractional exponents of negative numbers not supported")
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
@@ -204,7 +209,14 @@ class Power(Operation):
             Decimal: Result of the exponentiation.
         """
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), float(b)))
+        # Integral exponents stay in Decimal; only fractional ones need floats
+        integral_b = b.to_integral_value()
+        if b == integral_b:
+            if not a and not b:
+                # Decimal rejects 0 ** 0; keep the conventional result
+                return Decimal(1)
+            return a ** int(integral_b)
+        return Decimal(repr(float(a) ** float(b)))
 
 
 class Root(Operation):
@@ -228,10 +240,9 @@ class Root(Operation):
         Raises:
             ValidationError: If the number is negative or the root degree is zero.
         """
-        super().validate_operands(a, b)
-        if a < 0:
+        if a < _ZERO:
             raise ValidationError("Cannot calculate root of negative number")
-        if b == 0:
+        if b == _ZERO:
             raise ValidationError("Zero root is undefined")
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
@@ -246,7 +257,8 @@ class Root(Operation):
             Decimal: Result of the root calculation.
         """
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), 1 / float(b)))
+        # Build the Decimal from the float's repr to avoid binary-float noise
+        return Decimal(repr(float(a) ** (1.0 / float(b))))
 
 class Modulus(Operation):
     """
@@ -268,8 +280,7 @@ class Modulus(Operation):
         Raises:
             ValidationError: If the divisor is zero.
         """
-        super().validate_operands(a, b)
-        if b == 0:
+        if b == _ZERO:
             raise ValidationError("Modulus by zero is not allowed")
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
@@ -307,8 +318,7 @@ class Int_Divide(Operation):
         Raises:
             ValidationError: If the divisor is zero.
         """
-        super().validate_operands(a, b)
-        if b == 0:
+        if b == _ZERO:
             raise ValidationError("Integer division by zero is not allowed")
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
@@ -323,7 +333,11 @@ class Int_Divide(Operation):
             Decimal: Integer quotient of the division.
         """
         self.validate_operands(a, b)
-        return int(a / b)
+        # Decimal // truncates toward zero, but raises DivisionImpossible when
+        # the quotient has more digits than the context precision
+        with localcontext() as ctx:
+            ctx.prec = max(ctx.prec, a.adjusted() - b.adjusted() + 2)
+            return a // b
 
 
 class Percent(Operation):
@@ -334,16 +348,6 @@ class Percent(Operation):
     Example: a percent of b (i.e., (a / 100) * b).
     """
 
-    def validate_operands(self, a: Decimal, b: Decimal) -> None:
-        """
-        Validate operands for percentage operation.
-
-        Args:
-            a (Decimal): Percentage value.
-            b (Decimal): Number to apply the percentage to.
-        """
-        super().validate_operands(a, b)
-
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Calculate the percentage of a number.
@@ -355,8 +359,7 @@ class Percent(Operation):
         Returns:
             Decimal: Result of (a / 100) * b.
         """
-        self.validate_operands(a, b)
-        return (a / Decimal(100)) * b
+        return a * _HUNDREDTH * b
 
 
 class Abs_Diff(Operation):
@@ -377,7 +380,6 @@ class Abs_Diff(Operation):
         Returns:
             Decimal: Absolute value of the difference.
         """
-        self.validate_operands(a, b)
         return abs(a - b)
 
 class OperationFactory:
@@ -403,6 +405,9 @@ class OperationFactory:
         'abs_diff': Abs_Diff
     }
 
+    # Operations are stateless, so a single shared instance per identifier is reused
+    _instances: Dict[str, Operation] = {k: v() for k, v in _operations.items()}
+
     @classmethod
     def list_operations(cls) -> list[str]:
         """
@@ -429,15 +434,18 @@ class OperationFactory:
         """
         if not issubclass(operation_class, Operation):
             raise TypeError("Operation class must inherit from Operation")
-        cls._operations[name.lower()] = operation_class
+        key = sys.intern(name.lower())
+        cls._operations[key] = operation_class
+        cls._instances[key] = operation_class()
 
     @classmethod
     def create_operation(cls, operation_type: str) -> Operation:
         """
         Create an operation instance based on the operation type.
 
-        This method retrieves the appropriate operation class from the
-        _operations dictionary and instantiates it.
+        This method retrieves the shared instance of the appropriate operation
+        from the _instances dictionary. Lowercase identifiers are looked up
+        directly; other casings fall back to a case-insensitive lookup.
 
         Args:
             operation_type (str): The type of operation to create (e.g., 'add').
@@ -448,7 +456,11 @@ class OperationFactory:
         Raises:
             ValueError: If the operation type is unknown.
         """
-        operation_class = cls._operations.get(operation_type.lower())
-        if not operation_class:
-            raise ValueError(f"Unknown operation: {operation_type}")
-        return operation_class()
\ No newline at end of file
+        try:
+            return cls._instances[operation_type]
+        except KeyError:
+            pass
+        try:
+            return cls._instances[operation_type.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown operation: {operation_type}")
\ No newline at end of file
@@ -36,11 +36,32 @@ def test_power():
     assert calc.result == Decimal("8")
 
 
+def test_power_zero_zero():
+    calc = Calculation(operation="Power", operand1=Decimal("0"), operand2=Decimal("0"))
+    assert calc.result == Decimal("1")
+
+
+def test_power_and_root_keep_plain_integral_form():
+    assert str(Calculation(operation="Power", operand1=Decimal("1E+1"), operand2=Decimal("3")).result) == "1000"
+    assert str(Calculation(operation="Root", operand1=Decimal("27"), operand2=Decimal("3")).result) == "3"
+    assert str(Calculation(operation="Power", operand1=Decimal("4"), operand2=Decimal("0.5")).result) == "2"
+
+
+def test_int_divide_large_quotient():
+    calc = Calculation(operation="Int_Divide", operand1=Decimal("123456789012345678901234567890"), operand2=Decimal("7"))
+    assert calc.result == Decimal("17636684144620811271604938270")
+
+
 def test_negative_power():
     with pytest.raises(OperationError, match="Negative exponents are not supported"):
         Calculation(operation="Power", operand1=Decimal("2"), operand2=Decimal("-3"))
 
 
+def test_negative_base_fractional_power():
+    with pytest.raises(OperationError, match="Fractional exponents of negative numbers are not supported"):
+        Calculation(operation="Power", operand1=Decimal("-8"), operand2=Decimal("0.5"))
+
+
 def test_root():
     calc = Calculation(operation="Root", operand1=Decimal("16"), operand2=Decimal("2"))
     assert calc.result == Decimal("4")
@@ -52,7 +73,7 @@ def test_invalid_root():
 
 def test_calculation_failed():
     with pytest.raises(OperationError, match="Calculation failed:"):
-        Calculation(operation="Power", operand1=Decimal("100"), operand2=Decimal("1000"))
+        Calculation(operation="Power", operand1=Decimal("10"), operand2=Decimal("1000000"))
 
 
 def test_unknown_operation():
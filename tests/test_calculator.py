@@ -1,43 +1,129 @@
+import copy
 import datetime
+import logging
+import os
+import re
 from pathlib import Path
 import pandas as pd
 import pytest
-from unittest.mock import Mock, patch, PropertyMock
+from unittest.mock import Mock, patch
 from decimal import Decimal, getcontext
-from tempfile import TemporaryDirectory
+from tempfile import TemporaryDirectory, mkdtemp
 from app.calculation import Calculation
 from app.calculator import Calculator
 from app.calculator_memento import CalculatorMemento
-from app.calculator_repl import calculator_repl
+from app.calculator_repl import calculator_repl, _BRIGHT, _CYAN, _GREEN, _RED, _RESET, _YELLOW
 from app.calculator_config import CalculatorConfig
 from app.exceptions import OperationError, ValidationError
 from app.history import LoggingObserver, AutoSaveObserver
 from app.operations import OperationFactory
-from colorama import Fore, Style, init
 
-init(autoreset=True)
+# Operations are stateless, so tests share one instance resolved at import
+_ADD_OP = OperationFactory.create_operation('add')
+
+# Small Decimal constants shared across tests, parsed once
+_DEC = {i: Decimal(str(i)) for i in range(15)}
+
+# Sample calculation for the memento tests; copy it before use
+_CALC_PROTO = Calculation(operation="Addition", operand1=_DEC[2], operand2=_DEC[3])
+
+# Error messages expected from pytest.raises, compiled once
+_NO_OP_RE = re.compile("No operation set")
+_DISK_ERR_RE = re.compile("Failed to save history: Disk error")
+_READ_ERR_RE = re.compile("Failed to load history: Cannot read file")
+_UNEXPECTED_ERR_RE = re.compile("Operation failed: Unexpected error")
+
+# Fixed ISO timestamp so history and memento test data are deterministic
+_FIXED_TS = "2024-01-01T00:00:00"
+
+# Serialized memento holding one calculation, as produced by to_dict
+_MEMENTO_DICT = {
+    'history': [{
+        'operation': 'Addition',
+        'operand1': '2',
+        'operand2': '3',
+        'result': '5',
+        'timestamp': _FIXED_TS
+    }],
+    'timestamp': _FIXED_TS
+}
+
+# History frame returned by the mocked read_csv, built once with a fixed timestamp
+_LOAD_DF = pd.DataFrame.from_records(
+    [('Addition', '2', '3', '5', _FIXED_TS)],
+    columns=['operation', 'operand1', 'operand2', 'result', 'timestamp']
+)
+
+# Session-wide scratch directory, RAM-backed (tmpfs) where /dev/shm is available
+@pytest.fixture(scope="session")
+def calculator_root():
+    with TemporaryDirectory(dir="/dev/shm" if os.path.isdir("/dev/shm") else None) as temp_dir:
+        yield Path(temp_dir)
+
+# Config whose paths always resolve under base_dir, whatever the environment says
+class _PinnedConfig(CalculatorConfig):
+    log_dir = property(lambda self: self.base_dir / "logs")
+    log_file = property(lambda self: self.log_dir / "calculator.log")
+    history_dir = property(lambda self: self.base_dir / "history")
+    history_file = property(lambda self: self.history_dir / "calculator_history.csv")
+
+# One Calculator per module, so config setup runs once; it is built before the
+# per-test log muting applies, so skip its log file setup here
+@pytest.fixture(scope="module")
+def shared_calculator(calculator_root):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('app.calculator.logging.basicConfig', lambda *args, **kwargs: None)
+        return Calculator(config=_PinnedConfig(base_dir=Path(mkdtemp(dir=calculator_root))))
+
+# Fixture handing each test the shared Calculator reset to a clean state
+@pytest.fixture
+def calculator(shared_calculator):
+    config_state = vars(shared_calculator.config).copy()
+    shared_calculator.clear_history()
+    shared_calculator.observers.clear()
+    shared_calculator.operation_strategy = None
+    yield shared_calculator
+    # Undo any config changes made by the test
+    vars(shared_calculator.config).update(config_state)
+
+# Route log records nowhere and skip log file setup. Tests that check the
+# logging configuration itself run it for real, and whatever handlers they
+# install are closed and detached afterwards
+@pytest.fixture(autouse=True)
+def _mute_logs(monkeypatch, request):
+    root = logging.getLogger()
+    if request.node.get_closest_marker('no_mute_logs'):
+        monkeypatch.setattr(root, 'handlers', [])
+        yield
+        for handler in root.handlers:
+            handler.close()
+        return
+    monkeypatch.setattr(root, 'handlers', [logging.NullHandler()])
+    monkeypatch.setattr('app.calculator.logging.basicConfig', lambda *args, **kwargs: None)
+    yield
+
+# Skip the CSV write on save unless the test itself is about save_history
+@pytest.fixture(autouse=True)
+def _fast_save(monkeypatch, request):
+    if 'save_history' in request.node.name:
+        return
+    monkeypatch.setattr(Calculator, 'save_history', lambda self: None)
+
+# Fixture replacing builtins.print with a recorder that keeps each call's args
+@pytest.fixture
+def print_rec(monkeypatch):
+    rec = []
+    monkeypatch.setattr('builtins.print', lambda *args, **kwargs: rec.append(args))
+    return rec
 
-# Fixture to initialize Calculator with a temporary directory for file paths
+# Fixture wiring up REPL I/O: input answers from a list, prints into print_rec
 @pytest.fixture
-def calculator():
-    with TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        config = CalculatorConfig(base_dir=temp_path)
-
-        # Patch properties to use the temporary directory paths
-        with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-             patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
-             patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
-             patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
-            
-            # Set return values to use paths within the temporary directory
-            mock_log_dir.return_value = temp_path / "logs"
-            mock_log_file.return_value = temp_path / "logs/calculator.log"
-            mock_history_dir.return_value = temp_path / "history"
-            mock_history_file.return_value = temp_path / "history/calculator_history.csv"
-            
-            # Return an instance of Calculator with the mocked config
-            yield Calculator(config=config)
+def repl_io(monkeypatch, print_rec):
+    def _setup(inputs):
+        mock_input = Mock(side_effect=inputs)
+        monkeypatch.setattr('builtins.input', mock_input)
+        return mock_input, print_rec
+    return _setup
 
 # Test Calculator Initialization
 
@@ -49,37 +135,27 @@ def test_calculator_initialization(calculator):
 
 @patch('app.calculator_repl.Calculator.__init__', side_effect=RuntimeError("Initialization failed"))
 @patch('app.calculator_repl.logging.error')
-@patch('builtins.print')
-def test_repl_fatal_error_during_initialization(mock_print, mock_logging_error, mock_calc_init):
+def test_repl_fatal_error_during_initialization(mock_logging_error, mock_calc_init, print_rec):
     # Test the fatal error handler when Calculator initialization fails
     with pytest.raises(RuntimeError, match="Initialization failed"):
         calculator_repl()
     
-    assert any(f"{Fore.RED}Fatal error: Initialization failed{Style.RESET_ALL}")
+    assert (f"{_RED}{_BRIGHT}Fatal error: Initialization failed{_RESET}",) in print_rec
     mock_logging_error.assert_called_once_with("Fatal error in calculator REPL: Initialization failed")
 
 # Test Logging Setup
 
+@pytest.mark.no_mute_logs
 @patch('app.calculator.logging.info')
-def test_logging_setup(logging_info_mock):
-    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file:
-        mock_log_dir.return_value = Path('/tmp/logs')
-        mock_log_file.return_value = Path('/tmp/logs/calculator.log')
-        
-        Calculator(CalculatorConfig())
-        logging_info_mock.assert_any_call("Calculator initialized with configuration")
+def test_logging_setup(logging_info_mock, calculator_root):
+    Calculator(_PinnedConfig(base_dir=Path(mkdtemp(dir=calculator_root))))
+    logging_info_mock.assert_any_call("Calculator initialized with configuration")
 
+@pytest.mark.no_mute_logs
 @patch('app.calculator.logging.basicConfig', side_effect=PermissionError("Cannot write to log file"))
-def test_logging_setup_exception(logging_basicConfig_mock):
-    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file:
-        
-        mock_log_dir.return_value = Path('/tmp/logs')
-        mock_log_file.return_value = Path('/tmp/logs/calculator.log')
-        
-        with pytest.raises(PermissionError, match="Cannot write to log file"):
-            Calculator(CalculatorConfig())
+def test_logging_setup_exception(logging_basicConfig_mock, calculator_root):
+    with pytest.raises(PermissionError, match="Cannot write to log file"):
+        Calculator(_PinnedConfig(base_dir=Path(mkdtemp(dir=calculator_root))))
 
 # Test Adding and Removing Observers
 
@@ -97,38 +173,44 @@ def test_remove_observer(calculator):
 # Test Setting Operations
 
 def test_set_operation(calculator):
-    operation = OperationFactory.create_operation('add')
+    operation = _ADD_OP
     calculator.set_operation(operation)
     assert calculator.operation_strategy == operation
 
 # Test Performing Operations
 
 def test_perform_operation_addition(calculator):
-    operation = OperationFactory.create_operation('add')
+    operation = _ADD_OP
     calculator.set_operation(operation)
     result = calculator.perform_operation(2, 3)
-    assert result == Decimal('5')
+    assert result == _DEC[5]
+
+def test_perform_operation_keeps_sign_of_zero(calculator):
+    calculator.set_operation(OperationFactory.create_operation('multiply'))
+    assert str(calculator.perform_operation(5, '-0')) == '-0'
+    assert str(calculator.perform_operation(5, '0')) == '0'
+    assert str(calculator.history[-1].result) == '0'
 
 def test_perform_operation_validation_error(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.set_operation(_ADD_OP)
     with pytest.raises(ValidationError):
         calculator.perform_operation('invalid', 3)
 
 def test_perform_operation_operation_error(calculator):
-    with pytest.raises(OperationError, match="No operation set"):
+    with pytest.raises(OperationError, match=_NO_OP_RE):
         calculator.perform_operation(2, 3)
 
 # Test Undo/Redo Functionality
 
 def test_undo(calculator):
-    operation = OperationFactory.create_operation('add')
+    operation = _ADD_OP
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     calculator.undo()
     assert calculator.history == []
 
 def test_redo(calculator):
-    operation = OperationFactory.create_operation('add')
+    operation = _ADD_OP
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     calculator.undo()
@@ -139,32 +221,40 @@ def test_redo(calculator):
 
 @patch('app.calculator.pd.DataFrame.to_csv')
 def test_save_history(mock_to_csv, calculator):
-    operation = OperationFactory.create_operation('add')
+    operation = _ADD_OP
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     calculator.save_history()
     mock_to_csv.assert_called_once()
 
+def test_save_history_writes_csv(calculator):
+    calculator.set_operation(_ADD_OP)
+    calculator.perform_operation(2, 3)
+    calculator.save_history()
+    saved = pd.read_csv(calculator.config.history_file, dtype=str)
+    assert saved[['operation', 'operand1', 'operand2', 'result']].values.tolist() == [
+        ['Addition', '2', '3', '5']
+    ]
+
+def test_save_history_empty_writes_header(calculator):
+    calculator.save_history()
+    saved = pd.read_csv(calculator.config.history_file)
+    assert saved.empty
+    assert list(saved.columns) == ['operation', 'operand1', 'operand2', 'result', 'timestamp']
+
 @patch('app.calculator.Calculator.save_history')
-@patch('builtins.input', side_effect=['save', 'exit'])
-@patch('builtins.print')
-def test_repl_save_success(mock_print, mock_input, mock_save_history):
+def test_repl_save_success(mock_save_history, repl_io):
+    _, print_rec = repl_io(['save', 'exit'])
     calculator_repl()
     assert mock_save_history.call_count == 2
-    mock_print.assert_any_call(f"{Fore.GREEN}History saved successfully.{Style.RESET_ALL}")
-    mock_print.assert_any_call(f"{Fore.RED}{Style.BRIGHT}Goodbye!{Style.RESET_ALL}")
+    assert (f"{_GREEN}History saved successfully.{_RESET}",) in print_rec
+    assert (f"{_RED}{_BRIGHT}Goodbye!{_RESET}",) in print_rec
 
 @patch('app.calculator.pd.read_csv')
 @patch('app.calculator.Path.exists', return_value=True)
 def test_load_history(mock_exists, mock_read_csv, calculator):
     # Mock CSV data to match the expected format in from_dict
-    mock_read_csv.return_value = pd.DataFrame({
-        'operation': ['Addition'],
-        'operand1': ['2'],
-        'operand2': ['3'],
-        'result': ['5'],
-        'timestamp': [datetime.datetime.now().isoformat()]
-    })
+    mock_read_csv.return_value = _LOAD_DF.copy(deep=False)
     
     # Test the load_history functionality
     try:
@@ -173,27 +263,27 @@ def test_load_history(mock_exists, mock_read_csv, calculator):
         assert len(calculator.history) == 1
         # Verify the loaded values
         assert calculator.history[0].operation == "Addition"
-        assert calculator.history[0].operand1 == Decimal("2")
-        assert calculator.history[0].operand2 == Decimal("3")
-        assert calculator.history[0].result == Decimal("5")
+        assert calculator.history[0].operand1 == _DEC[2]
+        assert calculator.history[0].operand2 == _DEC[3]
+        assert calculator.history[0].result == _DEC[5]
+        assert calculator.history[0].timestamp == datetime.datetime(2024, 1, 1)
     except OperationError:
         pytest.fail("Loading history failed due to OperationError")
         
 @patch('app.calculator.Calculator.load_history')
-@patch('builtins.input', side_effect=['load', 'exit'])
-@patch('builtins.print')
-def test_repl_load_success(mock_print, mock_input, mock_load_history):
+def test_repl_load_success(mock_load_history, repl_io):
+    _, print_rec = repl_io(['load', 'exit'])
     # Simulate successful load
     calculator_repl()
     assert mock_load_history.call_count == 2
-    mock_print.assert_any_call(f"{Fore.GREEN}History loaded successfully{Style.RESET_ALL}")
-    mock_print.assert_any_call(f"{Fore.RED}{Style.BRIGHT}Goodbye!{Style.RESET_ALL}")
+    assert (f"{_GREEN}History loaded successfully{_RESET}",) in print_rec
+    assert (f"{_RED}{_BRIGHT}Goodbye!{_RESET}",) in print_rec
 
 def test_history_exceeds_max_history(calculator):
     # Set a small max_history_size for testing
     calculator.config.max_history_size = 3
     
-    operation = OperationFactory.create_operation('add')
+    operation = _ADD_OP
     calculator.set_operation(operation)
     
     # Perform 4 operations to exceed the max history size of 3
@@ -204,30 +294,28 @@ def test_history_exceeds_max_history(calculator):
     
     assert len(calculator.history) == 3
     
-    assert calculator.history[0].operand1 == Decimal('2')
-    assert calculator.history[1].operand1 == Decimal('3')
-    assert calculator.history[2].operand1 == Decimal('4')
+    assert [calc.operand1 for calc in calculator.history] == [_DEC[2], _DEC[3], _DEC[4]]
 
 @patch('app.calculator.pd.DataFrame.to_csv', side_effect=IOError("Disk error"))
 def test_save_history_exception(mock_to_csv, calculator):
     # Test that exceptions during save_history are caught
-    operation = OperationFactory.create_operation('add')
+    operation = _ADD_OP
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     
-    with pytest.raises(OperationError, match="Failed to save history: Disk error"):
+    with pytest.raises(OperationError, match=_DISK_ERR_RE):
         calculator.save_history()
 
 @patch('app.calculator.pd.read_csv', side_effect=IOError("Cannot read file"))
 @patch('app.calculator.Path.exists', return_value=True)
 def test_load_history_exception(mock_exists, mock_read_csv, calculator):
     # Test that exceptions during load_history are caught
-    with pytest.raises(OperationError, match="Failed to load history: Cannot read file"):
+    with pytest.raises(OperationError, match=_READ_ERR_RE):
         calculator.load_history()
 
 def test_get_history_dataframe(calculator):
     # Test that get_history_dataframe returns a proper pandas DataFrame
-    operation = OperationFactory.create_operation('add')
+    operation = _ADD_OP
     calculator.set_operation(operation)
     
     calculator.perform_operation(2, 3)
@@ -239,19 +327,18 @@ def test_get_history_dataframe(calculator):
     assert len(df) == 2
     assert list(df.columns) == ['operation', 'operand1', 'operand2', 'result', 'timestamp']
     
-    assert df.iloc[0]['operation'] == 'Addition'
-    assert df.iloc[0]['operand1'] == '2'
-    assert df.iloc[0]['operand2'] == '3'
-    assert df.iloc[0]['result'] == '5'
-    
-    assert df.iloc[1]['operand1'] == '5'
-    assert df.iloc[1]['operand2'] == '7'
-    assert df.iloc[1]['result'] == '12'
+    expected = pd.DataFrame({
+        'operation': ['Addition', 'Addition'],
+        'operand1': ['2', '5'],
+        'operand2': ['3', '7'],
+        'result': ['5', '12'],
+    })
+    pd.testing.assert_frame_equal(df[expected.columns].reset_index(drop=True), expected)
 
 # Test Clearing History
 
 def test_clear_history(calculator):
-    operation = OperationFactory.create_operation('add')
+    operation = _ADD_OP
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     calculator.clear_history()
@@ -261,156 +348,176 @@ def test_clear_history(calculator):
 
 # ===== REPL Tests =====
 
-@patch('builtins.input', side_effect=['exit'])
-@patch('builtins.print')
-def test_calculator_repl_exit(mock_print, mock_input):
+def test_calculator_repl_exit(repl_io):
+    _, print_rec = repl_io(['exit'])
     with patch('app.calculator.Calculator.save_history') as mock_save_history:
         calculator_repl()
         mock_save_history.assert_called_once()
-        mock_print.assert_any_call(f"{Fore.GREEN}History saved successfully.{Style.RESET_ALL}")
-        mock_print.assert_any_call(f"{Fore.RED}{Style.BRIGHT}Goodbye!{Style.RESET_ALL}")
+        assert (f"{_GREEN}History saved successfully.{_RESET}",) in print_rec
+        assert (f"{_RED}{_BRIGHT}Goodbye!{_RESET}",) in print_rec
 
-@patch('builtins.input', side_effect=['help', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_help(mock_print, mock_input):
+def test_calculator_repl_help(repl_io):
+    _, print_rec = repl_io(['help', 'exit'])
     calculator_repl()
-    mock_print.assert_any_call(f"\n{Fore.CYAN}Available commands:{Style.RESET_ALL}")
-
-
-@patch('builtins.input', side_effect=['add', '2', '3', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_addition(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 5{Style.RESET_ALL}")
+    msgs = [args[0] if args else '' for args in print_rec]
+    help_calls = [msg for msg in msgs if "Available commands:" in msg]
+    assert len(help_calls) == 1
+    assert "add , subtract" in help_calls[0]
+    assert "exit" in help_calls[0]
 
 # Additional REPL Tests
 
-@patch('builtins.input', side_effect=['history', 'clear', 'undo', 'redo', 'exit'])
-@patch('builtins.print')
-def test_repl_history_commands(mock_print, mock_input):
+def test_repl_history_commands(repl_io):
+    _, print_rec = repl_io(['history', 'clear', 'undo', 'redo', 'exit'])
     # Test history, clear, undo, redo on empty state
     with patch('app.calculator.Calculator.show_history', return_value=[]):
         calculator_repl()
-        mock_print.assert_any_call(f"{Fore.YELLOW}No calculations in history{Style.RESET_ALL}")
-        mock_print.assert_any_call(f"{Fore.GREEN}History cleared{Style.RESET_ALL}")
-        mock_print.assert_any_call(f"{Fore.YELLOW}Nothing to undo{Style.RESET_ALL}")
-        mock_print.assert_any_call(f"{Fore.YELLOW}Nothing to redo{Style.RESET_ALL}")
-
-
-@patch('builtins.input', side_effect=['add', '5', '3', 'history', 'undo', 'redo', 'exit'])
-@patch('builtins.print')
-def test_repl_operations_with_history(mock_print, mock_input):
-    # Test operation with history display and undo/redo
-    calculator_repl()
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 8{Style.RESET_ALL}")
-    assert any("Calculation History:" in str(call) for call in mock_print.call_args_list)
-    mock_print.assert_any_call(f"{Fore.GREEN}Operation undone{Style.RESET_ALL}")
-    mock_print.assert_any_call(f"{Fore.GREEN}Operation redone{Style.RESET_ALL}")
-
-
-@patch('builtins.input', side_effect=['add', 'cancel', 'subtract', '10', 'cancel', 'exit'])
-@patch('builtins.print')
-def test_repl_cancel_operations(mock_print, mock_input):
-    # Test cancel at both number prompts
-    calculator_repl()
-    cancelled_calls = sum(1 for call in mock_print.call_args_list if 'Operation cancelled' in str(call))
-    assert cancelled_calls == 2
-
-
-@patch('builtins.input', side_effect=[
-    'add', '5', '3',
-    'subtract', '10', '3',
-    'multiply', '6', '7',
-    'divide', '20', '6',
-    'power', '2', '3',
-    'root', '27', '3',
-    'modulus', '10', '2',
-    'int_divide', '19', '5',
-    'percent', '20', '80',
-    'abs_diff', '15', '7',
-    'exit'])
-@patch('builtins.print')
-def test_repl_all_operations(mock_print, mock_input):
-    # Test all arithmetic operations
+        assert (f"{_YELLOW}No calculations in history{_RESET}",) in print_rec
+        assert (f"{_GREEN}History cleared{_RESET}",) in print_rec
+        assert (f"{_YELLOW}Nothing to undo{_RESET}",) in print_rec
+        assert (f"{_YELLOW}Nothing to redo{_RESET}",) in print_rec
+
+
+_RESULT = f"\n{_GREEN}{_BRIGHT}Result: "
+
+# Each scenario feeds a command sequence to the REPL. `results` lists every
+# printed result in order; a message listed n times in `messages` must appear
+# in exactly n printed calls
+@pytest.mark.parametrize('inputs,results,messages', [
+    pytest.param(
+        ['add', '2', '3', 'exit'],
+        ['5'],
+        [],
+        id='addition'),
+    pytest.param(
+        ['add', '5', '3', 'history', 'undo', 'redo', 'exit'],
+        ['8'],
+        ["Calculation History:", f"1.{_RESET} Addition(5, 3) = 8",
+         f"{_GREEN}Operation undone{_RESET}", f"{_GREEN}Operation redone{_RESET}"],
+        id='operations_with_history'),
+    pytest.param(
+        ['add', 'cancel', 'subtract', '10', 'cancel', 'exit'],
+        [],
+        ['Operation cancelled'] * 2,
+        id='cancel_operations'),
+    pytest.param(
+        ['  ADD ', '2', 'Cancel', 'Multiply', '4', '3', 'exit'],
+        ['12'],
+        [f"{_YELLOW}Operation cancelled{_RESET}"],
+        id='commands_case_insensitive'),
+    pytest.param(
+        ['int_divide', '100', '5', 'int_divide', '7', '2', 'exit'],
+        ['20', '3'],
+        [],
+        id='integral_result_without_exponent'),
+    pytest.param(
+        ['power', '2', '100', 'power', '10', '40', 'exit'],
+        ['1.267650600228229401496703205E+30', '1E+40'],
+        [],
+        id='large_result_keeps_exponent'),
+    pytest.param(
+        ['add', '5', '3',
+         'subtract', '10', '3',
+         'multiply', '6', '7',
+         'divide', '20', '6',
+         'power', '2', '3',
+         'root', '27', '3',
+         'modulus', '10', '2',
+         'int_divide', '19', '5',
+         'percent', '20', '80',
+         'abs_diff', '15', '7',
+         'exit'],
+        ['8',             # add
+         '7',             # subtract
+         '42',            # multiply
+         '3.3333333333',  # divide
+         '8',             # power
+         '3',             # root
+         '0',             # modulus
+         '3',             # int_divide
+         '16',            # percent
+         '8'],            # abs_diff
+        [],
+        id='all_operations'),
+    pytest.param(
+        ['add', 'invalid', '3', 'divide', '5', '0', 'multiply', '2', '3', 'exit'],
+        ['6'],
+        ["Error:"] * 2,
+        id='error_handling_and_continue'),
+])
+def test_repl_scenarios(inputs, results, messages, repl_io, monkeypatch, tmp_path):
+    # Pin precision and give each scenario its own history so runs don't leak
+    monkeypatch.setenv('CALCULATOR_PRECISION', '10')
+    monkeypatch.setenv('CALCULATOR_HISTORY_FILE', str(tmp_path / 'history.csv'))
+    _, print_rec = repl_io(inputs)
     calculator_repl()
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 8{Style.RESET_ALL}")               # add
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 7{Style.RESET_ALL}")               # subtract
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 42{Style.RESET_ALL}")              # multiply
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 3.3333333333{Style.RESET_ALL}")    # divide
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 8{Style.RESET_ALL}")               # power
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 3{Style.RESET_ALL}")               # root
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 0{Style.RESET_ALL}")               # modulus
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 3{Style.RESET_ALL}")               # int_divide
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 16{Style.RESET_ALL}")              # percent
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 8{Style.RESET_ALL}")               # abs_diff
+    # Join the raw arguments so escapes like "\n" compare as printed
+    printed = [" ".join(map(str, args)) for args in print_rec]
+    # Pull every result out in one pass so a mismatch shows the whole sequence
+    assert [line for line in printed if line.startswith(_RESULT)] == [
+        f"{_RESULT}{result}{_RESET}" for result in results
+    ]
+    for message in set(messages):
+        assert sum(message in line for line in printed) == messages.count(message), message
 
 @patch('app.calculator.InputValidator.validate_number', side_effect=Exception("Unexpected error"))
 def test_perform_operation_unexpected_exception(mock_validate, calculator):
     # Test that unexpected exceptions in perform_operation are caught
-    operation = OperationFactory.create_operation('add')
+    operation = _ADD_OP
     calculator.set_operation(operation)
     
-    with pytest.raises(OperationError, match="Operation failed: Unexpected error"):
+    with pytest.raises(OperationError, match=_UNEXPECTED_ERR_RE):
         calculator.perform_operation(2, 3)
 
 @patch('app.calculator.Calculator.save_history', side_effect=Exception("Save error"))
 @patch('app.calculator.Calculator.load_history', side_effect=Exception("Load error"))
-@patch('builtins.input', side_effect=['save', 'load', 'exit'])
-@patch('builtins.print')
-def test_repl_save_load_errors(mock_print, mock_input, mock_load, mock_save):
+def test_repl_save_load_errors(mock_load, mock_save, repl_io):
+    _, print_rec = repl_io(['save', 'load', 'exit'])
     # Test save and load error handling
     calculator_repl()
-    assert any("Error saving history" in str(call) for call in mock_print.call_args_list)
-    assert any("Error loading history" in str(call) for call in mock_print.call_args_list)
+    msgs = [args[0] if args else '' for args in print_rec]
+    assert any("Error saving history" in msg for msg in msgs)
+    assert any("Error loading history" in msg for msg in msgs)
 
 
-@patch('builtins.input', side_effect=['add', 'invalid', '3', 'divide', '5', '0', 'multiply', '2', '3', 'exit'])
-@patch('builtins.print')
-def test_repl_error_handling_and_continue(mock_print, mock_input):
-    # Test ValidationError, OperationError, then successful operation
-    calculator_repl()
-    print_calls = [str(call) for call in mock_print.call_args_list]
-    assert sum("Error:" in call for call in print_calls) >= 2
-    mock_print.assert_any_call(f"\n{Fore.GREEN}{Style.BRIGHT}Result: 6{Style.RESET_ALL}")
-
-
-@patch('app.operations.OperationFactory.create_operation', side_effect=RuntimeError("Factory error"))
-@patch('builtins.input', side_effect=['add', '5', '3', 'exit'])
-@patch('builtins.print')
-def test_repl_unexpected_error(mock_print, mock_input, mock_factory):
+@patch('app.calculator.Calculator.perform_operation', side_effect=RuntimeError("Calculator error"))
+def test_repl_unexpected_error(mock_perform, repl_io):
+    _, print_rec = repl_io(['add', '5', '3', 'exit'])
     # Test unexpected exception handling
     calculator_repl()
-    assert any("Unexpected error:" in str(call) for call in mock_print.call_args_list)
+    msgs = [args[0] if args else '' for args in print_rec]
+    assert any("Unexpected error:" in msg for msg in msgs)
 
 
 @patch('app.calculator.Calculator.save_history', side_effect=IOError("Disk error"))
-@patch('builtins.input', side_effect=['unknown_cmd', 'exit'])
-@patch('builtins.print')
-def test_repl_unknown_command_and_exit_error(mock_print, mock_input, mock_save):
+def test_repl_unknown_command_and_exit_error(mock_save, repl_io):
+    _, print_rec = repl_io(['unknown_cmd', 'exit'])
     # Test unknown command and exit with save error
     calculator_repl()
-    assert any("Unknown command" in str(call) for call in mock_print.call_args_list)
-    assert any("Warning: Could not save history" in str(call) for call in mock_print.call_args_list)
-    mock_print.assert_any_call(f"{Fore.RED}{Style.BRIGHT}Goodbye!{Style.RESET_ALL}")
+    msgs = [args[0] if args else '' for args in print_rec]
+    assert any("Unknown command" in msg for msg in msgs)
+    assert any("Warning: Could not save history" in msg for msg in msgs)
+    assert (f"{_RED}{_BRIGHT}Goodbye!{_RESET}",) in print_rec
 
 
-@patch('builtins.input', side_effect=[KeyboardInterrupt(), EOFError()])
-@patch('builtins.print')
-def test_repl_interrupts(mock_print, mock_input):
+def test_repl_interrupts(monkeypatch, print_rec):
     # Test KeyboardInterrupt and EOFError
+    def _raising_input(*args, _errors=iter([KeyboardInterrupt, EOFError]), **kwargs):
+        raise next(_errors)()
+    monkeypatch.setattr('builtins.input', _raising_input)
     calculator_repl()
-    mock_print.assert_any_call(f"\n{Fore.CYAN}Input terminated. Exiting...{Style.RESET_ALL}")
+    assert (f"\n{_CYAN}Input terminated. Exiting...{_RESET}",) in print_rec
 
-@patch('builtins.input', side_effect=[Exception("Unexpected loop error"), 'exit'])
-@patch('builtins.print')
-def test_repl_exception_in_loop(mock_print, mock_input):
+def test_repl_exception_in_loop(repl_io):
+    _, print_rec = repl_io([Exception("Unexpected loop error"), 'exit'])
     # Test generic exception handler in main loop
     calculator_repl()
-    assert any("Error: Unexpected loop error" in str(call) for call in mock_print.call_args_list)
-    mock_print.assert_any_call(f"{Fore.RED}{Style.BRIGHT}Goodbye!{Style.RESET_ALL}")
+    msgs = [args[0] if args else '' for args in print_rec]
+    assert any("Error: Unexpected loop error" in msg for msg in msgs)
+    assert (f"{_RED}{_BRIGHT}Goodbye!{_RESET}",) in print_rec
 
 def test_calculator_memento_to_dict():
-    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    calc = copy.copy(_CALC_PROTO)
     memento = CalculatorMemento(history=[calc])
     memento_dict = memento.to_dict()
 
@@ -431,23 +538,17 @@ def test_calculator_memento_to_dict():
 
 # Test for from_dict()
 def test_calculator_memento_from_dict():
-    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
-    memento_dict = {
-        'history': [calc.to_dict()],  # Serialize a sample calculation
-        'timestamp': datetime.datetime.now().isoformat()  # Current timestamp in ISO format
-    }
-
-    memento_restored = CalculatorMemento.from_dict(memento_dict)
+    memento_restored = CalculatorMemento.from_dict(_MEMENTO_DICT)
 
     assert isinstance(memento_restored, CalculatorMemento)
     assert len(memento_restored.history) == 1
     assert memento_restored.history[0].operation == "Addition"
-    assert memento_restored.history[0].operand1 == Decimal("2")
-    assert memento_restored.history[0].operand2 == Decimal("3")
-    assert memento_restored.history[0].result == Decimal("5")
+    assert memento_restored.history[0].operand1 == _DEC[2]
+    assert memento_restored.history[0].operand2 == _DEC[3]
+    assert memento_restored.history[0].result == _DEC[5]
     assert isinstance(memento_restored.timestamp, datetime.datetime)
 
-    assert memento_restored.timestamp.isoformat() == memento_dict['timestamp']
+    assert memento_restored.timestamp.isoformat() == _FIXED_TS
 
 
 # Test for from_dict() with missing or invalid data
@@ -30,6 +30,14 @@ class TestOperation:
 
         assert str(TestOp()) == "TestOp"
 
+    def test_default_validation_accepts_operands(self):
+        """Test that the base validation accepts any operands."""
+        class TestOp(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return a
+
+        assert TestOp().validate_operands(Decimal("-1"), Decimal("0")) is None
+
 
 class BaseOperationTest:
     """Base test class for all operations."""
@@ -149,6 +157,9 @@ class TestPower(BaseOperationTest):
         "one_exponent": {"a": "5", "b": "1", "expected": "5"},
         "decimal_base": {"a": "2.5", "b": "2", "expected": "6.25"},
         "zero_base": {"a": "0", "b": "5", "expected": "0"},
+        "zero_zero": {"a": "0", "b": "0", "expected": "1"},
+        "large_integer_result": {"a": "3", "b": "40", "expected": "12157665459056928801"},
+        "fractional_exponent": {"a": "4", "b": "0.5", "expected": "2"},
     }
     invalid_test_cases = {
         "negative_exponent": {
@@ -157,6 +168,12 @@ class TestPower(BaseOperationTest):
             "error": ValidationError,
             "message": "Negative exponents not supported"
         },
+        "negative_base_fractional_exponent": {
+            "a": "-8",
+            "b": "0.5",
+            "error": ValidationError,
+            "message": "Fractional exponents of negative numbers not supported"
+        },
     }
 
 
@@ -215,6 +232,12 @@ class TestIntDivide(BaseOperationTest):
         "negative_b": {"a": "5", "b": "-2", "expected": "-2"},
         "both_negative": {"a": "-5", "b": "-2", "expected": "2"},
         "zero_a": {"a": "0", "b": "3", "expected": "0"},
+        "large_quotient": {
+            "a": "123456789012345678901234567890",
+            "b": "7",
+            "expected": "17636684144620811271604938270"
+        },
+        "quotient_beyond_precision": {"a": "1e30", "b": "1", "expected": "1e30"},
     }
     invalid_test_cases = {
         "int_divide_by_zero": {
@@ -276,6 +299,12 @@ class TestOperationFactory:
             operation = OperationFactory.create_operation(op_name.upper())
             assert isinstance(operation, op_class)
 
+    def test_create_operation_reuses_instance(self):
+        """Test that repeated creation returns the same shared instance."""
+        first = OperationFactory.create_operation('add')
+        second = OperationFactory.create_operation('ADD')
+        assert first is second
+
     def test_create_invalid_operation(self):
         """Test creation of invalid operation raises error."""
         with pytest.raises(ValueError, match="Unknown operation: invalid_op"):
@@ -1,8 +1,8 @@
 import pytest
-from decimal import Decimal
+from decimal import Decimal, localcontext
 from app.calculator_config import CalculatorConfig
 from app.exceptions import ValidationError
-from app.input_validators import InputValidator  # adjust as per your file structure
+from app.input_validators import InputValidator, _parse_number  # adjust as per your file structure
 
 # Sample configuration with a max input value of 1 million for testing purposes
 config = CalculatorConfig(max_input_value=Decimal('1000000'))
@@ -39,6 +39,19 @@ def test_validate_number_zero():
 def test_validate_number_trimmed_string():
     assert InputValidator.validate_number("  456  ", config) == Decimal('456')
 
+def test_validate_number_repeated_string_reuses_parse():
+    InputValidator.validate_number("3.14", config)
+    hits = _parse_number.cache_info().hits
+    assert InputValidator.validate_number(" 3.14 ", config) == Decimal("3.14")
+    assert _parse_number.cache_info().hits == hits + 1
+
+def test_validate_number_cached_string_follows_context_precision():
+    text = "1.23456789012345678901234567890123"
+    InputValidator.validate_number(text, config)
+    with localcontext() as ctx:
+        ctx.prec = 50
+        assert InputValidator.validate_number(text, config) == Decimal(text)
+
 # Negative test cases
 def test_validate_number_invalid_string():
     with pytest.raises(ValidationError, match="Invalid number format: abc"):